@@ -1,30 +1,85 @@
-"""Benchmarks for HashMap implementation."""
+"""Benchmarks for the HashMap implementations.
+
+Each benchmark runs against the pure-Python HashMap and, when built, the C
+extension; the ``python``/``c`` parameter in the benchmark name tells them
+apart.
+"""
 
 import json
+import sys
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, List, Optional
 import pytest
 
-from dsa_lab import HashMap
+try:
+    import numpy as np
+except ImportError:  # Optional: only needed to read columnar .npz workloads
+    np = None
+
+
+# Operation codes, matching OP_CODES in tools/gen_workloads.py
+OP_INSERT = 0
+OP_GET = 1
+OP_DELETE = 2
+
+_OP_CODES = {"insert": OP_INSERT, "get": OP_GET, "delete": OP_DELETE}
+
+
+def _to_columns(operations: Iterable[dict]) -> dict:
+    """Split operation dicts into parallel ``ops``, ``keys`` and ``values`` lists."""
+    ops: List[int] = []
+    keys: List[str] = []
+    values: List[str] = []
+    intern = sys.intern
+    for op in operations:
+        ops.append(_OP_CODES[op["op"]])
+        keys.append(intern(op["key"]))
+        values.append(op.get("value", ""))
+    return {"ops": ops, "keys": keys, "values": values}
+
+
+def _is_fresh(path: Path, source: Path) -> bool:
+    """Return True if ``path`` exists and is not older than ``source``."""
+    if not path.exists():
+        return False
+    return not source.exists() or path.stat().st_mtime_ns >= source.stat().st_mtime_ns
 
 
 def load_workload(name: str) -> Optional[dict]:
-    """Load a workload file."""
-    paths = [
-        Path(__file__).parent.parent.parent.parent
-        / "workloads"
-        / "map"
-        / f"{name}.json",
-        Path(__file__).parent.parent.parent.parent.parent
-        / "workloads"
-        / "map"
-        / f"{name}.json",
+    """Load a workload as parallel ``ops``, ``keys`` and ``values`` lists.
+
+    Prefers the columnar ``.npz`` file written by the generator when NumPy is
+    available, then the ``.jsonl`` file (parsed one operation at a time),
+    falling back to the JSON workload. A derived ``.npz`` or ``.jsonl`` older
+    than its ``.json`` is stale and skipped.
+
+    Keys are interned so repeated occurrences of a key are one object, and
+    stored keys compare equal to lookup keys by identity.
+    """
+    dirs = [
+        Path(__file__).parent.parent.parent.parent / "workloads" / "map",
+        Path(__file__).parent.parent.parent.parent.parent / "workloads" / "map",
     ]
 
-    for path in paths:
+    for workload_dir in dirs:
+        path = workload_dir / f"{name}.json"
+        npz_path = workload_dir / f"{name}.npz"
+        if np is not None and _is_fresh(npz_path, path):
+            with np.load(npz_path) as data:
+                return {
+                    "ops": data["ops"].tolist(),
+                    "keys": list(map(sys.intern, data["keys"].tolist())),
+                    "values": data["values"].tolist(),
+                }
+
+        jsonl_path = workload_dir / f"{name}.jsonl"
+        if _is_fresh(jsonl_path, path):
+            with open(jsonl_path) as f:
+                return _to_columns(map(json.loads, f))
+
         if path.exists():
             with open(path) as f:
-                return json.load(f)
+                return _to_columns(json.load(f)["operations"])
     return None
 
 
@@ -32,12 +87,12 @@ class TestInsertBenchmarks:
     """Insert operation benchmarks."""
 
     @pytest.mark.parametrize("size", [100, 1000, 10000])
-    def test_insert(self, benchmark, size: int) -> None:
+    def test_insert(self, benchmark, hashmap_cls: type, size: int) -> None:
         keys = [f"key_{i}" for i in range(size)]
         values = [f"value_{i}" for i in range(size)]
 
         def run():
-            m = HashMap()
+            m = hashmap_cls.with_capacity(size)
             for key, value in zip(keys, values):
                 m.insert(key, value)
             return m
@@ -50,9 +105,9 @@ class TestGetBenchmarks:
     """Get operation benchmarks."""
 
     @pytest.mark.parametrize("size", [100, 1000, 10000])
-    def test_get(self, benchmark, size: int) -> None:
+    def test_get(self, benchmark, hashmap_cls: type, size: int) -> None:
         keys = [f"key_{i}" for i in range(size)]
-        m = HashMap()
+        m = hashmap_cls()
         for i, key in enumerate(keys):
             m.insert(key, f"value_{i}")
 
@@ -66,56 +121,96 @@ class TestGetBenchmarks:
 class TestWorkloadBenchmarks:
     """Workload-based benchmarks."""
 
-    def test_mixed_uniform_medium(self, benchmark) -> None:
+    def test_mixed_uniform_medium(self, benchmark, hashmap_cls: type) -> None:
         workload = load_workload("mixed_uniform_medium")
         if workload is None:
             pytest.skip("Workload not found")
 
-        operations = workload["operations"]
+        operations = tuple(zip(workload["ops"], workload["keys"], workload["values"]))
 
         def run():
-            m = HashMap()
-            for op in operations:
-                if op["op"] == "insert":
-                    m.insert(op["key"], op.get("value", ""))
-                elif op["op"] == "get":
-                    m.get(op["key"])
-                elif op["op"] == "delete":
-                    m.remove(op["key"])
+            m = hashmap_cls.with_capacity(len(operations))
+            insert, get, remove = m.insert, m.get, m.remove
+            for code, key, value in operations:
+                if code == OP_GET:
+                    get(key)
+                elif code == OP_INSERT:
+                    insert(key, value)
+                elif code == OP_DELETE:
+                    remove(key)
             return m
 
         benchmark(run)
 
-    def test_insert_heavy_uniform_medium(self, benchmark) -> None:
+    def test_insert_heavy_uniform_medium(self, benchmark, hashmap_cls: type) -> None:
         workload = load_workload("insert_heavy_uniform_medium")
         if workload is None:
             pytest.skip("Workload not found")
 
-        operations = workload["operations"]
+        inserts = [
+            (key, value)
+            for code, key, value in zip(
+                workload["ops"], workload["keys"], workload["values"]
+            )
+            if code == OP_INSERT
+        ]
+        keys = [key for key, _ in inserts]
+        values = [value for _, value in inserts]
 
         def run():
-            m = HashMap()
-            for op in operations:
-                if op["op"] == "insert":
-                    m.insert(op["key"], op.get("value", ""))
+            m = hashmap_cls.with_capacity(len(keys))
+            m.bulk_insert(keys, values)
             return m
 
         benchmark(run)
 
-    def test_read_heavy_uniform_medium(self, benchmark) -> None:
+    def test_read_heavy_uniform_medium(self, benchmark, hashmap_cls: type) -> None:
         workload = load_workload("read_heavy_uniform_medium")
         if workload is None:
             pytest.skip("Workload not found")
 
-        operations = workload["operations"]
+        operations = tuple(zip(workload["ops"], workload["keys"], workload["values"]))
 
         def run():
-            m = HashMap()
-            for op in operations:
-                if op["op"] == "insert":
-                    m.insert(op["key"], op.get("value", ""))
-                elif op["op"] == "get":
-                    m.get(op["key"])
+            m = hashmap_cls.with_capacity(len(operations))
+            insert, get = m.insert, m.get
+            for code, key, value in operations:
+                if code == OP_GET:
+                    get(key)
+                elif code == OP_INSERT:
+                    insert(key, value)
             return m
 
         benchmark(run)
+
+
+class TestNumbaBenchmarks:
+    """Benchmarks for the Numba-backed integer HashMap."""
+
+    @pytest.mark.parametrize("size", [100, 1000, 10000])
+    def test_insert_numba(self, benchmark, size: int) -> None:
+        hashmap_numba = pytest.importorskip("dsa_lab.hashmap_numba")
+        keys = list(range(size))
+
+        def run():
+            m = hashmap_numba.HashMapNumba()
+            for key in keys:
+                m.insert(key, key)
+            return m
+
+        result = benchmark(run)
+        assert len(result) == size
+
+    @pytest.mark.parametrize("size", [100, 1000, 10000])
+    def test_bulk_insert_numba(self, benchmark, size: int) -> None:
+        hashmap_numba = pytest.importorskip("dsa_lab.hashmap_numba")
+        np = pytest.importorskip("numpy")
+        keys = np.arange(size, dtype=np.int64)
+
+        def run():
+            m = hashmap_numba.HashMapNumba()
+            m.bulk_insert(keys, keys)
+            return m
+
+        result = benchmark(run)
+        assert len(result) == size
@@ -0,0 +1,20 @@
+"""Shared fixtures for the HashMap tests and benchmarks."""
+
+import pytest
+
+from dsa_lab.hashmap import HashMap as PyHashMap
+
+try:
+    from dsa_lab._hashmap import HashMap as CHashMap
+except ImportError:  # C extension not built
+    CHashMap = None
+
+
+@pytest.fixture(params=["python", "c"])
+def hashmap_cls(request: pytest.FixtureRequest) -> type:
+    """Each HashMap implementation; the C one is skipped when not built."""
+    if request.param == "c":
+        if CHashMap is None:
+            pytest.skip("C extension not built")
+        return CHashMap
+    return PyHashMap
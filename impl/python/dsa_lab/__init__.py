@@ -1,6 +1,9 @@
 """dsa-lab: Data Structures & Algorithms Lab - Python Implementation"""
 
-from .hashmap import HashMap
+try:
+    from ._hashmap import HashMap
+except ImportError:  # C extension not built; use the pure-Python implementation
+    from .hashmap import HashMap
 
 __all__ = ["HashMap"]
 __version__ = "0.1.0"
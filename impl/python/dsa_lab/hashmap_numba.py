@@ -0,0 +1,313 @@
+"""Integer-keyed hash map with a Numba-compiled probe loop.
+
+Collisions are resolved with triangular (quadratic) probing: the i-th probe
+advances by i slots, which visits every slot of a power-of-two table.
+
+Requires the optional ``numba`` extra (``pip install dsa-lab[numba]``).
+"""
+
+import operator
+from typing import Iterator, Optional, Tuple
+
+import numpy as np
+from numba import njit
+
+from .hashmap import DEFAULT_CAPACITY, MAX_LOAD_FACTOR
+
+
+_EMPTY = 0
+_TOMBSTONE = 1
+_OCCUPIED = 2
+
+
+@njit(cache=True)
+def _hash_nb(key: int) -> int:
+    """Mix an integer key (SplitMix64 finalizer) so sequential keys spread out."""
+    h = np.uint64(key)
+    h = (h ^ (h >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    h = (h ^ (h >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    h = h ^ (h >> np.uint64(31))
+    return np.int64(h >> np.uint64(1))
+
+
+@njit(cache=True)
+def _find_slot_nb(
+    keys: np.ndarray, states: np.ndarray, mask: int, key: int
+) -> Tuple[int, bool]:
+    """Find the slot for a key, returning (index, found)."""
+    index = _hash_nb(key) & mask
+    step = 1
+    first_tombstone = -1
+
+    for _ in range(mask + 1):
+        s = states[index]
+        if s == _EMPTY:
+            if first_tombstone >= 0:
+                return first_tombstone, False
+            return index, False
+        elif s == _TOMBSTONE:
+            if first_tombstone < 0:
+                first_tombstone = index
+        elif keys[index] == key:
+            return index, True
+        index = (index + step) & mask
+        step += 1
+
+    if first_tombstone >= 0:
+        return first_tombstone, False
+    return 0, False
+
+
+@njit(cache=True)
+def _rehash_nb(
+    old_keys: np.ndarray,
+    old_values: np.ndarray,
+    old_states: np.ndarray,
+    keys: np.ndarray,
+    values: np.ndarray,
+    states: np.ndarray,
+    mask: int,
+) -> None:
+    """Move every occupied slot of the old table into an empty new table."""
+    for i in range(old_states.shape[0]):
+        if old_states[i] == _OCCUPIED:
+            index = _hash_nb(old_keys[i]) & mask
+            step = 1
+            while states[index] != _EMPTY:
+                index = (index + step) & mask
+                step += 1
+            keys[index] = old_keys[i]
+            values[index] = old_values[i]
+            states[index] = _OCCUPIED
+
+
+@njit(cache=True)
+def _bulk_insert_nb(
+    keys: np.ndarray,
+    values: np.ndarray,
+    states: np.ndarray,
+    mask: int,
+    new_keys: np.ndarray,
+    new_values: np.ndarray,
+) -> Tuple[int, int]:
+    """Insert parallel key/value arrays; the table must already have room.
+
+    Returns:
+        Tuple of (added, reused_tombstones) for size bookkeeping.
+    """
+    added = 0
+    reused_tombstones = 0
+    for i in range(new_keys.shape[0]):
+        index, found = _find_slot_nb(keys, states, mask, new_keys[i])
+        if not found:
+            if states[index] == _TOMBSTONE:
+                reused_tombstones += 1
+            keys[index] = new_keys[i]
+            states[index] = _OCCUPIED
+            added += 1
+        values[index] = new_values[i]
+    return added, reused_tombstones
+
+
+class HashMapNumba:
+    """Open-addressing hash map over int64 keys and values.
+
+    Unlike ``HashMap``, which needs linear probing for backward-shift
+    deletion, this map keeps tombstones and so can use triangular probing.
+
+    Storage is three parallel NumPy arrays (keys, values, slot states) and
+    probing runs in Numba-compiled code. String keys must be mapped to
+    integers by the caller; non-integer keys and values (e.g. floats) raise
+    TypeError rather than being truncated.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        """Create a new HashMapNumba with the specified capacity."""
+        capacity = max(capacity, DEFAULT_CAPACITY)
+        capacity = 1 << (capacity - 1).bit_length()
+        self._alloc(capacity)
+        self._size: int = 0
+        self._tombstones: int = 0
+
+    def _alloc(self, capacity: int) -> None:
+        """Allocate empty storage arrays for the given capacity."""
+        self._mask: int = capacity - 1
+        self._resize_at: int = int(capacity * MAX_LOAD_FACTOR)
+        self._keys = np.zeros(capacity, dtype=np.int64)
+        self._values = np.zeros(capacity, dtype=np.int64)
+        self._states = np.zeros(capacity, dtype=np.uint8)
+
+    def __len__(self) -> int:
+        """Return the number of elements in the map."""
+        return self._size
+
+    def __bool__(self) -> bool:
+        """Return True if the map is not empty."""
+        return self._size > 0
+
+    @property
+    def capacity(self) -> int:
+        """Return the current capacity of the map."""
+        return self._mask + 1
+
+    def _resize(self, new_capacity: int) -> None:
+        """Rebuild the hash map with the given power-of-two capacity."""
+        old_keys, old_values, old_states = self._keys, self._values, self._states
+        self._alloc(new_capacity)
+        _rehash_nb(
+            old_keys,
+            old_values,
+            old_states,
+            self._keys,
+            self._values,
+            self._states,
+            self._mask,
+        )
+        self._tombstones = 0
+
+    def _grow_or_compact(self) -> None:
+        """Make room once live entries plus tombstones reach the threshold.
+
+        Mostly tombstones: rehash at the same capacity to drop them, so
+        insert/remove churn does not grow the table. Otherwise double it.
+        """
+        if self._size < self._resize_at // 2:
+            self._resize(self._mask + 1)
+        else:
+            self._resize((self._mask + 1) * 2)
+
+    def insert(self, key: int, value: int) -> Optional[int]:
+        """Insert a key-value pair into the map.
+
+        Returns:
+            The previous value if the key existed, None otherwise.
+
+        Raises:
+            TypeError: If key or value is not an integer.
+        """
+        key, value = operator.index(key), operator.index(value)
+        if self._size + self._tombstones >= self._resize_at:
+            self._grow_or_compact()
+
+        index, found = _find_slot_nb(self._keys, self._states, self._mask, key)
+
+        if found:
+            old_value = int(self._values[index])
+            self._values[index] = value
+            return old_value
+
+        if self._states[index] == _TOMBSTONE:
+            self._tombstones -= 1
+
+        self._keys[index] = key
+        self._values[index] = value
+        self._states[index] = _OCCUPIED
+        self._size += 1
+        return None
+
+    def reserve(self, n: int) -> None:
+        """Grow the map so it can hold n elements without further resizing."""
+        capacity = self._mask + 1
+        while n > capacity * MAX_LOAD_FACTOR:
+            capacity *= 2
+        if capacity != self._mask + 1:
+            self._resize(capacity)
+
+    def bulk_insert(self, keys: np.ndarray, values: np.ndarray) -> None:
+        """Insert parallel int64 key/value arrays in a single compiled loop.
+
+        Raises:
+            TypeError: If keys or values cannot be cast to int64 without loss
+                (e.g. floats).
+            ValueError: If keys and values are not 1-D arrays of the same
+                length.
+        """
+        keys = np.ascontiguousarray(
+            np.asarray(keys).astype(np.int64, casting="safe", copy=False)
+        )
+        values = np.ascontiguousarray(
+            np.asarray(values).astype(np.int64, casting="safe", copy=False)
+        )
+        if keys.ndim != 1 or keys.shape != values.shape:
+            raise ValueError("keys and values must be 1-D arrays of the same length")
+        if self._tombstones and (
+            self._size + self._tombstones + keys.shape[0] > self._resize_at
+        ):
+            # Drop tombstones first so they do not count towards growth
+            self._resize(self._mask + 1)
+        self.reserve(self._size + keys.shape[0])
+        added, reused_tombstones = _bulk_insert_nb(
+            self._keys, self._values, self._states, self._mask, keys, values
+        )
+        self._size += added
+        self._tombstones -= reused_tombstones
+
+    def get(self, key: int) -> Optional[int]:
+        """Get the value associated with a key, or None if absent."""
+        key = operator.index(key)
+        index, found = _find_slot_nb(self._keys, self._states, self._mask, key)
+        if found:
+            return int(self._values[index])
+        return None
+
+    def remove(self, key: int) -> Optional[int]:
+        """Remove a key and return its value, or None if absent."""
+        key = operator.index(key)
+        index, found = _find_slot_nb(self._keys, self._states, self._mask, key)
+        if found:
+            self._states[index] = _TOMBSTONE
+            self._size -= 1
+            self._tombstones += 1
+            return int(self._values[index])
+        return None
+
+    def contains(self, key: int) -> bool:
+        """Check if the map contains the given key."""
+        key = operator.index(key)
+        _, found = _find_slot_nb(self._keys, self._states, self._mask, key)
+        return bool(found)
+
+    def clear(self) -> None:
+        """Remove all entries from the map."""
+        self._states[:] = _EMPTY
+        self._size = 0
+        self._tombstones = 0
+
+    def keys(self) -> Iterator[int]:
+        """Iterate over all keys in the map."""
+        for key in self._keys[self._states == _OCCUPIED].tolist():
+            yield key
+
+    def values(self) -> Iterator[int]:
+        """Iterate over all values in the map."""
+        for value in self._values[self._states == _OCCUPIED].tolist():
+            yield value
+
+    def items(self) -> Iterator[Tuple[int, int]]:
+        """Iterate over all key-value pairs in the map."""
+        occupied = self._states == _OCCUPIED
+        yield from zip(self._keys[occupied].tolist(), self._values[occupied].tolist())
+
+    def __contains__(self, key: int) -> bool:
+        """Support 'in' operator."""
+        return self.contains(key)
+
+    def __getitem__(self, key: int) -> int:
+        """Support bracket notation for getting values."""
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: int, value: int) -> None:
+        """Support bracket notation for setting values."""
+        self.insert(key, value)
+
+    def __delitem__(self, key: int) -> None:
+        """Support del operator."""
+        if self.remove(key) is None:
+            raise KeyError(key)
+
+    def __iter__(self) -> Iterator[int]:
+        """Iterate over keys."""
+        return self.keys()
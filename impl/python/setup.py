@@ -0,0 +1,18 @@
+"""Build the optional C extension backing dsa_lab.HashMap.
+
+All project metadata lives in pyproject.toml. The extension is marked
+optional, so installation falls back to the pure-Python HashMap when no C
+compiler is available.
+"""
+
+from setuptools import Extension, setup
+
+setup(
+    ext_modules=[
+        Extension(
+            "dsa_lab._hashmap",
+            sources=["src/_hashmap.c"],
+            optional=True,
+        )
+    ]
+)
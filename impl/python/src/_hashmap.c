@@ -0,0 +1,777 @@
+/*
+ * C implementation of dsa_lab.HashMap.
+ *
+ * Mirrors dsa_lab/hashmap.py: open addressing with linear probing over a
+ * power-of-two table, cached key hashes, and backward-shift deletion. Keys,
+ * values and hashes are stored in three parallel arrays; an empty slot has a
+ * NULL key.
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <string.h>
+
+#define DEFAULT_CAPACITY 16
+
+/* Resize when size / capacity >= 3/4 (MAX_LOAD_FACTOR = 0.75). */
+#define OVER_LOAD(size, capacity) ((size) * 4 >= (capacity) * 3)
+
+typedef struct {
+    PyObject_HEAD
+    Py_ssize_t size;
+    size_t mask;
+    PyObject **keys;
+    PyObject **values;
+    Py_hash_t *hashes;
+} HashMapObject;
+
+static PyTypeObject HashMapType;
+
+/* Round a requested capacity up to a power of two, at least DEFAULT_CAPACITY. */
+static Py_ssize_t
+normalize_capacity(Py_ssize_t capacity)
+{
+    Py_ssize_t result = DEFAULT_CAPACITY;
+    while (result < capacity) {
+        if (result > PY_SSIZE_T_MAX / 2) {
+            PyErr_NoMemory();
+            return -1;
+        }
+        result <<= 1;
+    }
+    return result;
+}
+
+/* Allocate empty storage arrays. Returns 0 on success, -1 with MemoryError. */
+static int
+alloc_table(Py_ssize_t capacity, PyObject ***keys, PyObject ***values,
+            Py_hash_t **hashes)
+{
+    *keys = PyMem_Calloc((size_t)capacity, sizeof(PyObject *));
+    *values = PyMem_Calloc((size_t)capacity, sizeof(PyObject *));
+    *hashes = PyMem_Calloc((size_t)capacity, sizeof(Py_hash_t));
+    if (*keys == NULL || *values == NULL || *hashes == NULL) {
+        PyMem_Free(*keys);
+        PyMem_Free(*values);
+        PyMem_Free(*hashes);
+        *keys = NULL;
+        *values = NULL;
+        *hashes = NULL;
+        PyErr_NoMemory();
+        return -1;
+    }
+    return 0;
+}
+
+/*
+ * Find the slot for a key. Returns 1 if found, 0 if not (with *index set to
+ * the empty slot where it would go), or -1 if a key comparison raised.
+ */
+static int
+find_slot(HashMapObject *self, PyObject *key, Py_hash_t hash, size_t *index)
+{
+restart:;
+    PyObject **keys = self->keys;
+    size_t mask = self->mask;
+    size_t i = (size_t)hash & mask;
+
+    for (size_t n = 0; n <= mask; n++) {
+        PyObject *k = keys[i];
+
+        if (k == NULL) {
+            *index = i;
+            return 0;
+        }
+        if (k == key) {
+            *index = i;
+            return 1;
+        }
+        if (self->hashes[i] == hash) {
+            Py_INCREF(k);
+            int cmp = PyObject_RichCompareBool(k, key, Py_EQ);
+            Py_DECREF(k);
+            if (cmp < 0) {
+                return -1;
+            }
+            /* __eq__ may have mutated the map; start over if so. */
+            if (self->keys != keys || self->mask != mask || keys[i] != k) {
+                goto restart;
+            }
+            if (cmp) {
+                *index = i;
+                return 1;
+            }
+        }
+        i = (i + 1) & mask;
+    }
+
+    *index = 0;
+    return 0;
+}
+
+/* Place a key known to be absent into the first empty slot of its run. */
+static void
+insert_new_unchecked(PyObject **keys, PyObject **values, Py_hash_t *hashes,
+                     size_t mask, Py_hash_t hash, PyObject *key,
+                     PyObject *value)
+{
+    size_t i = (size_t)hash & mask;
+    while (keys[i] != NULL) {
+        i = (i + 1) & mask;
+    }
+    keys[i] = key;
+    values[i] = value;
+    hashes[i] = hash;
+}
+
+/* Rebuild the table with a new power-of-two capacity. */
+static int
+resize(HashMapObject *self, Py_ssize_t new_capacity)
+{
+    PyObject **keys, **values;
+    Py_hash_t *hashes;
+
+    if (alloc_table(new_capacity, &keys, &values, &hashes) < 0) {
+        return -1;
+    }
+
+    size_t new_mask = (size_t)new_capacity - 1;
+    for (size_t i = 0; i <= self->mask; i++) {
+        if (self->keys[i] != NULL) {
+            insert_new_unchecked(keys, values, hashes, new_mask,
+                                 self->hashes[i], self->keys[i],
+                                 self->values[i]);
+        }
+    }
+
+    PyMem_Free(self->keys);
+    PyMem_Free(self->values);
+    PyMem_Free(self->hashes);
+    self->keys = keys;
+    self->values = values;
+    self->hashes = hashes;
+    self->mask = new_mask;
+    return 0;
+}
+
+/* Grow the table so it can hold n elements without further resizing. */
+static int
+reserve(HashMapObject *self, Py_ssize_t n)
+{
+    Py_ssize_t capacity = (Py_ssize_t)self->mask + 1;
+
+    if (n > PY_SSIZE_T_MAX / 4) {
+        PyErr_NoMemory();
+        return -1;
+    }
+    while (n * 4 > capacity * 3) {
+        if (capacity > PY_SSIZE_T_MAX / 8) {
+            PyErr_NoMemory();
+            return -1;
+        }
+        capacity <<= 1;
+    }
+    if ((size_t)capacity != self->mask + 1) {
+        return resize(self, capacity);
+    }
+    return 0;
+}
+
+/*
+ * Insert a key-value pair whose hash is already known, without checking the
+ * load factor. Returns a new reference to the previous value or None.
+ */
+static PyObject *
+insert_with_hash(HashMapObject *self, Py_hash_t hash, PyObject *key,
+                 PyObject *value)
+{
+    size_t i;
+    int found = find_slot(self, key, hash, &i);
+
+    if (found < 0) {
+        return NULL;
+    }
+    Py_INCREF(value);
+    if (found) {
+        PyObject *old_value = self->values[i];
+        self->values[i] = value;
+        return old_value;
+    }
+
+    Py_INCREF(key);
+    self->keys[i] = key;
+    self->values[i] = value;
+    self->hashes[i] = hash;
+    self->size++;
+    Py_RETURN_NONE;
+}
+
+/* Insert with the load-factor check. Returns a new reference or NULL. */
+static PyObject *
+insert(HashMapObject *self, PyObject *key, PyObject *value)
+{
+    Py_hash_t hash = PyObject_Hash(key);
+
+    if (hash == -1) {
+        return NULL;
+    }
+    if (OVER_LOAD((size_t)self->size, self->mask + 1)
+        && resize(self, (Py_ssize_t)(self->mask + 1) * 2) < 0) {
+        return NULL;
+    }
+    return insert_with_hash(self, hash, key, value);
+}
+
+/* Empty a slot, shifting later entries of its probe run back into it. */
+static void
+backshift(HashMapObject *self, size_t index)
+{
+    PyObject **keys = self->keys;
+    PyObject **values = self->values;
+    Py_hash_t *hashes = self->hashes;
+    size_t mask = self->mask;
+    size_t hole = index;
+    size_t j = index;
+
+    for (;;) {
+        j = (j + 1) & mask;
+        if (keys[j] == NULL) {
+            break;
+        }
+        /* The entry at j may fill the hole only if its home slot is not
+         * cyclically within (hole, j]. */
+        if (((j - (size_t)hashes[j]) & mask) >= ((j - hole) & mask)) {
+            keys[hole] = keys[j];
+            values[hole] = values[j];
+            hashes[hole] = hashes[j];
+            hole = j;
+        }
+    }
+
+    keys[hole] = NULL;
+    values[hole] = NULL;
+}
+
+/*
+ * Remove a key. Returns a new reference to the removed value, NULL without
+ * an exception set if the key is absent, or NULL with an exception on error.
+ */
+static PyObject *
+remove_key(HashMapObject *self, PyObject *key)
+{
+    size_t i;
+    Py_hash_t hash = PyObject_Hash(key);
+
+    if (hash == -1) {
+        return NULL;
+    }
+    int found = find_slot(self, key, hash, &i);
+    if (found <= 0) {
+        return NULL;
+    }
+
+    PyObject *old_key = self->keys[i];
+    PyObject *old_value = self->values[i];
+    backshift(self, i);
+    self->size--;
+    Py_DECREF(old_key);
+    return old_value;
+}
+
+/*
+ * Look up a key. Returns a borrowed reference to the value, NULL without an
+ * exception set if the key is absent, or NULL with an exception on error.
+ */
+static PyObject *
+lookup(HashMapObject *self, PyObject *key)
+{
+    size_t i;
+    Py_hash_t hash = PyObject_Hash(key);
+
+    if (hash == -1) {
+        return NULL;
+    }
+    int found = find_slot(self, key, hash, &i);
+    if (found <= 0) {
+        return NULL;
+    }
+    return self->values[i];
+}
+
+/* Drop every entry. References are released after the table is emptied. */
+static int
+clear_entries(HashMapObject *self)
+{
+    PyObject **keys, **values;
+    Py_hash_t *hashes;
+    PyObject **old_keys = self->keys;
+    PyObject **old_values = self->values;
+    size_t capacity = self->mask + 1;
+
+    if (alloc_table((Py_ssize_t)capacity, &keys, &values, &hashes) < 0) {
+        return -1;
+    }
+    PyMem_Free(self->hashes);
+    self->keys = keys;
+    self->values = values;
+    self->hashes = hashes;
+    self->size = 0;
+
+    for (size_t i = 0; i < capacity; i++) {
+        Py_XDECREF(old_keys[i]);
+        Py_XDECREF(old_values[i]);
+    }
+    PyMem_Free(old_keys);
+    PyMem_Free(old_values);
+    return 0;
+}
+
+/* Collect the occupied slots into a list: 0 = keys, 1 = values, 2 = items. */
+static PyObject *
+collect(HashMapObject *self, int which)
+{
+    PyObject *list = PyList_New(0);
+
+    if (list == NULL) {
+        return NULL;
+    }
+    for (size_t i = 0; i <= self->mask; i++) {
+        PyObject *item;
+        int rc;
+
+        if (self->keys[i] == NULL) {
+            continue;
+        }
+        if (which == 0) {
+            rc = PyList_Append(list, self->keys[i]);
+        }
+        else if (which == 1) {
+            rc = PyList_Append(list, self->values[i]);
+        }
+        else {
+            item = PyTuple_Pack(2, self->keys[i], self->values[i]);
+            if (item == NULL) {
+                Py_DECREF(list);
+                return NULL;
+            }
+            rc = PyList_Append(list, item);
+            Py_DECREF(item);
+        }
+        if (rc < 0) {
+            Py_DECREF(list);
+            return NULL;
+        }
+    }
+    return list;
+}
+
+static PyObject *
+collect_iter(HashMapObject *self, int which)
+{
+    PyObject *list = collect(self, which);
+    PyObject *it;
+
+    if (list == NULL) {
+        return NULL;
+    }
+    it = PyObject_GetIter(list);
+    Py_DECREF(list);
+    return it;
+}
+
+/* ---- Type slots --------------------------------------------------------- */
+
+static PyObject *
+HashMap_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
+{
+    static char *kwlist[] = {"capacity", NULL};
+    Py_ssize_t capacity = DEFAULT_CAPACITY;
+    HashMapObject *self;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "|n:HashMap", kwlist,
+                                     &capacity)) {
+        return NULL;
+    }
+    capacity = normalize_capacity(capacity);
+    if (capacity < 0) {
+        return NULL;
+    }
+
+    self = (HashMapObject *)type->tp_alloc(type, 0);
+    if (self == NULL) {
+        return NULL;
+    }
+    if (alloc_table(capacity, &self->keys, &self->values, &self->hashes) < 0) {
+        Py_DECREF(self);
+        return NULL;
+    }
+    self->mask = (size_t)capacity - 1;
+    self->size = 0;
+    return (PyObject *)self;
+}
+
+static int
+HashMap_traverse(HashMapObject *self, visitproc visit, void *arg)
+{
+    if (self->keys == NULL) {
+        return 0;
+    }
+    for (size_t i = 0; i <= self->mask; i++) {
+        Py_VISIT(self->keys[i]);
+        Py_VISIT(self->values[i]);
+    }
+    return 0;
+}
+
+static int
+HashMap_tp_clear(HashMapObject *self)
+{
+    if (self->keys == NULL) {
+        return 0;
+    }
+    for (size_t i = 0; i <= self->mask; i++) {
+        Py_CLEAR(self->keys[i]);
+        Py_CLEAR(self->values[i]);
+    }
+    self->size = 0;
+    return 0;
+}
+
+static void
+HashMap_dealloc(HashMapObject *self)
+{
+    PyObject_GC_UnTrack(self);
+    HashMap_tp_clear(self);
+    PyMem_Free(self->keys);
+    PyMem_Free(self->values);
+    PyMem_Free(self->hashes);
+    Py_TYPE(self)->tp_free((PyObject *)self);
+}
+
+static Py_ssize_t
+HashMap_length(HashMapObject *self)
+{
+    return self->size;
+}
+
+static PyObject *
+HashMap_subscript(HashMapObject *self, PyObject *key)
+{
+    PyObject *value = lookup(self, key);
+
+    if (value == NULL) {
+        if (!PyErr_Occurred()) {
+            PyErr_SetObject(PyExc_KeyError, key);
+        }
+        return NULL;
+    }
+    Py_INCREF(value);
+    return value;
+}
+
+static int
+HashMap_ass_subscript(HashMapObject *self, PyObject *key, PyObject *value)
+{
+    PyObject *old;
+
+    if (value == NULL) {
+        old = remove_key(self, key);
+        if (old == NULL) {
+            if (!PyErr_Occurred()) {
+                PyErr_SetObject(PyExc_KeyError, key);
+            }
+            return -1;
+        }
+    }
+    else {
+        old = insert(self, key, value);
+        if (old == NULL) {
+            return -1;
+        }
+    }
+    Py_DECREF(old);
+    return 0;
+}
+
+static int
+HashMap_sq_contains(HashMapObject *self, PyObject *key)
+{
+    size_t i;
+    Py_hash_t hash = PyObject_Hash(key);
+
+    if (hash == -1) {
+        return -1;
+    }
+    return find_slot(self, key, hash, &i);
+}
+
+static PyObject *
+HashMap_iter(HashMapObject *self)
+{
+    return collect_iter(self, 0);
+}
+
+/* ---- Methods ------------------------------------------------------------ */
+
+static PyObject *
+HashMap_with_capacity(PyTypeObject *type, PyObject *arg)
+{
+    Py_ssize_t n = PyLong_AsSsize_t(arg);
+
+    if (n == -1 && PyErr_Occurred()) {
+        return NULL;
+    }
+    if (n < 0) {
+        n = 0;
+    }
+    if (n > PY_SSIZE_T_MAX / 4) {
+        return PyErr_NoMemory();
+    }
+    return PyObject_CallFunction((PyObject *)type, "n", (n * 4 + 2) / 3);
+}
+
+static PyObject *
+HashMap_insert(HashMapObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    if (nargs != 2) {
+        PyErr_Format(PyExc_TypeError,
+                     "insert() takes exactly 2 arguments (%zd given)", nargs);
+        return NULL;
+    }
+    return insert(self, args[0], args[1]);
+}
+
+static PyObject *
+HashMap_get(HashMapObject *self, PyObject *key)
+{
+    PyObject *value = lookup(self, key);
+
+    if (value == NULL) {
+        if (PyErr_Occurred()) {
+            return NULL;
+        }
+        Py_RETURN_NONE;
+    }
+    Py_INCREF(value);
+    return value;
+}
+
+static PyObject *
+HashMap_remove(HashMapObject *self, PyObject *key)
+{
+    PyObject *value = remove_key(self, key);
+
+    if (value == NULL) {
+        if (PyErr_Occurred()) {
+            return NULL;
+        }
+        Py_RETURN_NONE;
+    }
+    return value;
+}
+
+static PyObject *
+HashMap_contains(HashMapObject *self, PyObject *key)
+{
+    int found = HashMap_sq_contains(self, key);
+
+    if (found < 0) {
+        return NULL;
+    }
+    return PyBool_FromLong(found);
+}
+
+static PyObject *
+HashMap_reserve(HashMapObject *self, PyObject *arg)
+{
+    Py_ssize_t n = PyLong_AsSsize_t(arg);
+
+    if (n == -1 && PyErr_Occurred()) {
+        return NULL;
+    }
+    if (reserve(self, n) < 0) {
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+HashMap_bulk_insert(HashMapObject *self, PyObject *const *args,
+                    Py_ssize_t nargs)
+{
+    PyObject *keys, *values;
+    Py_ssize_t n;
+
+    if (nargs != 2) {
+        PyErr_Format(PyExc_TypeError,
+                     "bulk_insert() takes exactly 2 arguments (%zd given)",
+                     nargs);
+        return NULL;
+    }
+    keys = PySequence_Fast(args[0], "keys must be a sequence");
+    if (keys == NULL) {
+        return NULL;
+    }
+    values = PySequence_Fast(args[1], "values must be a sequence");
+    if (values == NULL) {
+        Py_DECREF(keys);
+        return NULL;
+    }
+
+    n = PySequence_Fast_GET_SIZE(keys);
+    if (PySequence_Fast_GET_SIZE(values) != n) {
+        PyErr_SetString(PyExc_ValueError,
+                        "keys and values must have the same length");
+        goto error;
+    }
+    if (reserve(self, self->size + n) < 0) {
+        goto error;
+    }
+
+    for (Py_ssize_t i = 0; i < n; i++) {
+        PyObject *key = PySequence_Fast_GET_ITEM(keys, i);
+        PyObject *old;
+        Py_hash_t hash = PyObject_Hash(key);
+
+        if (hash == -1) {
+            goto error;
+        }
+        old = insert_with_hash(self, hash, key,
+                               PySequence_Fast_GET_ITEM(values, i));
+        if (old == NULL) {
+            goto error;
+        }
+        Py_DECREF(old);
+    }
+
+    Py_DECREF(keys);
+    Py_DECREF(values);
+    Py_RETURN_NONE;
+
+error:
+    Py_DECREF(keys);
+    Py_DECREF(values);
+    return NULL;
+}
+
+static PyObject *
+HashMap_clear(HashMapObject *self, PyObject *Py_UNUSED(ignored))
+{
+    if (clear_entries(self) < 0) {
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+HashMap_keys(HashMapObject *self, PyObject *Py_UNUSED(ignored))
+{
+    return collect_iter(self, 0);
+}
+
+static PyObject *
+HashMap_values(HashMapObject *self, PyObject *Py_UNUSED(ignored))
+{
+    return collect_iter(self, 1);
+}
+
+static PyObject *
+HashMap_items(HashMapObject *self, PyObject *Py_UNUSED(ignored))
+{
+    return collect_iter(self, 2);
+}
+
+static PyObject *
+HashMap_get_capacity(HashMapObject *self, void *Py_UNUSED(closure))
+{
+    return PyLong_FromSize_t(self->mask + 1);
+}
+
+static PyMethodDef HashMap_methods[] = {
+    {"with_capacity", (PyCFunction)HashMap_with_capacity,
+     METH_O | METH_CLASS,
+     "Create a HashMap that can hold n elements without resizing."},
+    {"insert", (PyCFunction)(void (*)(void))HashMap_insert, METH_FASTCALL,
+     "Insert a key-value pair; return the previous value or None."},
+    {"get", (PyCFunction)HashMap_get, METH_O,
+     "Get the value associated with a key, or None."},
+    {"remove", (PyCFunction)HashMap_remove, METH_O,
+     "Remove a key; return the removed value or None."},
+    {"contains", (PyCFunction)HashMap_contains, METH_O,
+     "Check if the map contains the given key."},
+    {"reserve", (PyCFunction)HashMap_reserve, METH_O,
+     "Grow the map so it can hold n elements without further resizing."},
+    {"bulk_insert", (PyCFunction)(void (*)(void))HashMap_bulk_insert,
+     METH_FASTCALL, "Insert many key-value pairs in one call."},
+    {"clear", (PyCFunction)HashMap_clear, METH_NOARGS,
+     "Remove all entries from the map."},
+    {"keys", (PyCFunction)HashMap_keys, METH_NOARGS,
+     "Iterate over all keys in the map."},
+    {"values", (PyCFunction)HashMap_values, METH_NOARGS,
+     "Iterate over all values in the map."},
+    {"items", (PyCFunction)HashMap_items, METH_NOARGS,
+     "Iterate over all key-value pairs in the map."},
+    {NULL, NULL, 0, NULL},
+};
+
+static PyGetSetDef HashMap_getset[] = {
+    {"capacity", (getter)HashMap_get_capacity, NULL,
+     "The current capacity of the map.", NULL},
+    {NULL, NULL, NULL, NULL, NULL},
+};
+
+static PyMappingMethods HashMap_as_mapping = {
+    .mp_length = (lenfunc)HashMap_length,
+    .mp_subscript = (binaryfunc)HashMap_subscript,
+    .mp_ass_subscript = (objobjargproc)HashMap_ass_subscript,
+};
+
+static PySequenceMethods HashMap_as_sequence = {
+    .sq_contains = (objobjproc)HashMap_sq_contains,
+};
+
+static PyTypeObject HashMapType = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    .tp_name = "dsa_lab._hashmap.HashMap",
+    .tp_doc = PyDoc_STR(
+        "Hash map implementation using open addressing with linear probing."),
+    .tp_basicsize = sizeof(HashMapObject),
+    .tp_flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC,
+    .tp_new = HashMap_new,
+    .tp_dealloc = (destructor)HashMap_dealloc,
+    .tp_traverse = (traverseproc)HashMap_traverse,
+    .tp_clear = (inquiry)HashMap_tp_clear,
+    .tp_iter = (getiterfunc)HashMap_iter,
+    .tp_methods = HashMap_methods,
+    .tp_getset = HashMap_getset,
+    .tp_as_mapping = &HashMap_as_mapping,
+    .tp_as_sequence = &HashMap_as_sequence,
+};
+
+static struct PyModuleDef hashmap_module = {
+    PyModuleDef_HEAD_INIT,
+    .m_name = "dsa_lab._hashmap",
+    .m_doc = "C implementation of dsa_lab.HashMap.",
+    .m_size = -1,
+};
+
+PyMODINIT_FUNC
+PyInit__hashmap(void)
+{
+    PyObject *m;
+
+    if (PyType_Ready(&HashMapType) < 0) {
+        return NULL;
+    }
+    m = PyModule_Create(&hashmap_module);
+    if (m == NULL) {
+        return NULL;
+    }
+    Py_INCREF(&HashMapType);
+    if (PyModule_AddObject(m, "HashMap", (PyObject *)&HashMapType) < 0) {
+        Py_DECREF(&HashMapType);
+        Py_DECREF(m);
+        return NULL;
+    }
+    return m;
+}
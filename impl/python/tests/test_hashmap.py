@@ -1,55 +1,54 @@
 """Unit tests for HashMap implementation."""
 
 import pytest
-from dsa_lab import HashMap
 
 
 class TestHashMapBasic:
     """Basic HashMap tests."""
 
-    def test_new_map_is_empty(self) -> None:
-        m = HashMap()
+    def test_new_map_is_empty(self, hashmap_cls: type) -> None:
+        m = hashmap_cls()
         assert len(m) == 0
         assert not m
 
-    def test_insert_and_get(self) -> None:
-        m = HashMap()
+    def test_insert_and_get(self, hashmap_cls: type) -> None:
+        m = hashmap_cls()
         result = m.insert("key1", "value1")
         assert result is None
         assert m.get("key1") == "value1"
         assert len(m) == 1
 
-    def test_insert_overwrite(self) -> None:
-        m = HashMap()
+    def test_insert_overwrite(self, hashmap_cls: type) -> None:
+        m = hashmap_cls()
         m.insert("key", "value1")
         old = m.insert("key", "value2")
         assert old == "value1"
         assert m.get("key") == "value2"
         assert len(m) == 1
 
-    def test_remove(self) -> None:
-        m = HashMap()
+    def test_remove(self, hashmap_cls: type) -> None:
+        m = hashmap_cls()
         m.insert("key", "value")
         removed = m.remove("key")
         assert removed == "value"
         assert m.get("key") is None
         assert len(m) == 0
 
-    def test_remove_non_existent(self) -> None:
-        m = HashMap()
+    def test_remove_non_existent(self, hashmap_cls: type) -> None:
+        m = hashmap_cls()
         removed = m.remove("nonexistent")
         assert removed is None
 
-    def test_contains(self) -> None:
-        m = HashMap()
+    def test_contains(self, hashmap_cls: type) -> None:
+        m = hashmap_cls()
         m.insert("key", "value")
         assert m.contains("key")
         assert not m.contains("other")
         assert "key" in m
         assert "other" not in m
 
-    def test_clear(self) -> None:
-        m = HashMap()
+    def test_clear(self, hashmap_cls: type) -> None:
+        m = hashmap_cls()
         m.insert("key1", "value1")
         m.insert("key2", "value2")
         m.clear()
@@ -60,8 +59,8 @@ class TestHashMapBasic:
 class TestHashMapResize:
     """Tests for HashMap resizing."""
 
-    def test_resize(self) -> None:
-        m = HashMap(capacity=4)
+    def test_resize(self, hashmap_cls: type) -> None:
+        m = hashmap_cls(capacity=4)
         for i in range(100):
             m.insert(f"key{i}", f"value{i}")
 
@@ -69,8 +68,79 @@ class TestHashMapResize:
         for i in range(100):
             assert m.get(f"key{i}") == f"value{i}"
 
-    def test_tombstone_reuse(self) -> None:
-        m = HashMap()
+    def test_capacity_rounds_to_power_of_two(self, hashmap_cls: type) -> None:
+        m = hashmap_cls(capacity=100)
+        assert m.capacity == 128
+
+        for i in range(200):
+            m.insert(f"key{i}", f"value{i}")
+        assert m.capacity & (m.capacity - 1) == 0
+
+    def test_with_capacity_avoids_resize(self, hashmap_cls: type) -> None:
+        m = hashmap_cls.with_capacity(1000)
+        capacity = m.capacity
+        for i in range(1000):
+            m.insert(f"key{i}", f"value{i}")
+        assert m.capacity == capacity
+
+    def test_reserve(self, hashmap_cls: type) -> None:
+        m = hashmap_cls()
+        m.insert("key", "value")
+        m.reserve(1000)
+        capacity = m.capacity
+        assert capacity >= 1000
+        for i in range(999):
+            m.insert(f"key{i}", f"value{i}")
+        assert m.capacity == capacity
+        assert m.get("key") == "value"
+
+    def test_bulk_insert(self, hashmap_cls: type) -> None:
+        m = hashmap_cls()
+        m.insert("key0", "old")
+        m.insert("gone", "value")
+        m.remove("gone")
+        keys = [f"key{i}" for i in range(100)]
+        values = [f"value{i}" for i in range(100)]
+        m.bulk_insert(keys, values)
+
+        assert len(m) == 100
+        for i in range(100):
+            assert m.get(f"key{i}") == f"value{i}"
+        assert m.get("gone") is None
+
+    def test_bulk_insert_rejects_length_mismatch(self, hashmap_cls: type) -> None:
+        m = hashmap_cls()
+        with pytest.raises(ValueError):
+            m.bulk_insert(["a", "b", "c"], ["1"])
+        with pytest.raises(ValueError):
+            m.bulk_insert(["a"], ["1", "2"])
+        assert len(m) == 0
+
+    def test_remove_churn_does_not_grow(self, hashmap_cls: type) -> None:
+        m = hashmap_cls()
+        for i in range(10000):
+            m.insert(f"key{i}", f"value{i}")
+            m.insert(f"key{i + 1}", f"value{i + 1}")
+            m.remove(f"key{i}")
+            m.remove(f"key{i + 1}")
+
+        assert len(m) == 0
+        assert m.capacity == 16
+
+    def test_remove_keeps_probe_runs_intact(self, hashmap_cls: type) -> None:
+        m = hashmap_cls()
+        keys = [f"key{i}" for i in range(12)]
+        for key in keys:
+            m.insert(key, key)
+
+        for removed in keys[::3]:
+            m.remove(removed)
+        for key in keys:
+            expected = None if key in keys[::3] else key
+            assert m.get(key) == expected
+
+    def test_tombstone_reuse(self, hashmap_cls: type) -> None:
+        m = hashmap_cls()
         m.insert("key1", "value1")
         m.insert("key2", "value2")
         m.remove("key1")
@@ -85,34 +155,34 @@ class TestHashMapResize:
 class TestHashMapPythonic:
     """Tests for Pythonic interface."""
 
-    def test_bracket_get(self) -> None:
-        m = HashMap()
+    def test_bracket_get(self, hashmap_cls: type) -> None:
+        m = hashmap_cls()
         m.insert("key", "value")
         assert m["key"] == "value"
 
-    def test_bracket_get_missing(self) -> None:
-        m = HashMap()
+    def test_bracket_get_missing(self, hashmap_cls: type) -> None:
+        m = hashmap_cls()
         with pytest.raises(KeyError):
             _ = m["nonexistent"]
 
-    def test_bracket_set(self) -> None:
-        m = HashMap()
+    def test_bracket_set(self, hashmap_cls: type) -> None:
+        m = hashmap_cls()
         m["key"] = "value"
         assert m.get("key") == "value"
 
-    def test_del(self) -> None:
-        m = HashMap()
+    def test_del(self, hashmap_cls: type) -> None:
+        m = hashmap_cls()
         m.insert("key", "value")
         del m["key"]
         assert m.get("key") is None
 
-    def test_del_missing(self) -> None:
-        m = HashMap()
+    def test_del_missing(self, hashmap_cls: type) -> None:
+        m = hashmap_cls()
         with pytest.raises(KeyError):
             del m["nonexistent"]
 
-    def test_iter(self) -> None:
-        m = HashMap()
+    def test_iter(self, hashmap_cls: type) -> None:
+        m = hashmap_cls()
         m.insert("a", "1")
         m.insert("b", "2")
         m.insert("c", "3")
@@ -121,20 +191,20 @@ class TestHashMapPythonic:
         assert len(keys) == 3
         assert set(keys) == {"a", "b", "c"}
 
-    def test_keys(self) -> None:
-        m = HashMap()
+    def test_keys(self, hashmap_cls: type) -> None:
+        m = hashmap_cls()
         m.insert("a", "1")
         m.insert("b", "2")
         assert set(m.keys()) == {"a", "b"}
 
-    def test_values(self) -> None:
-        m = HashMap()
+    def test_values(self, hashmap_cls: type) -> None:
+        m = hashmap_cls()
         m.insert("a", "1")
         m.insert("b", "2")
         assert set(m.values()) == {"1", "2"}
 
-    def test_items(self) -> None:
-        m = HashMap()
+    def test_items(self, hashmap_cls: type) -> None:
+        m = hashmap_cls()
         m.insert("a", "1")
         m.insert("b", "2")
         assert set(m.items()) == {("a", "1"), ("b", "2")}
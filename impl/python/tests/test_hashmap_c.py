@@ -0,0 +1,62 @@
+"""Tests for the C extension HashMap, checked against the pure-Python one."""
+
+import random
+
+import pytest
+
+from dsa_lab.hashmap import HashMap as PyHashMap
+
+_hashmap = pytest.importorskip("dsa_lab._hashmap")
+CHashMap = _hashmap.HashMap
+
+
+class TestCHashMap:
+    """Compare the C HashMap against the pure-Python implementation."""
+
+    def test_is_exported(self) -> None:
+        import dsa_lab
+
+        assert dsa_lab.HashMap is CHashMap
+
+    def test_capacity_matches(self) -> None:
+        for capacity in (0, 4, 16, 17, 100):
+            assert CHashMap(capacity=capacity).capacity == PyHashMap(capacity).capacity
+        assert CHashMap.with_capacity(1000).capacity == (
+            PyHashMap.with_capacity(1000).capacity
+        )
+
+    def test_mixed_operations(self) -> None:
+        rng = random.Random(42)
+        c_map = CHashMap()
+        py_map = PyHashMap()
+
+        for i in range(10000):
+            op = rng.randint(0, 3)
+            key = f"key_{rng.randint(0, 99)}"
+            value = f"value_{i}"
+
+            if op == 0:
+                assert c_map.insert(key, value) == py_map.insert(key, value)
+            elif op == 1:
+                assert c_map.get(key) == py_map.get(key)
+            elif op == 2:
+                assert c_map.remove(key) == py_map.remove(key)
+            else:
+                assert (key in c_map) == (key in py_map)
+
+        assert len(c_map) == len(py_map)
+        assert c_map.capacity == py_map.capacity
+        assert dict(c_map.items()) == dict(py_map.items())
+
+    def test_bulk_insert_and_reserve(self) -> None:
+        m = CHashMap()
+        m.reserve(1000)
+        capacity = m.capacity
+        m.bulk_insert([f"key{i}" for i in range(1000)], ["v"] * 1000)
+        assert len(m) == 1000
+        assert m.capacity == capacity
+
+    def test_unhashable_key(self) -> None:
+        m = CHashMap()
+        with pytest.raises(TypeError):
+            m.insert([], "value")
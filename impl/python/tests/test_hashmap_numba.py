@@ -0,0 +1,119 @@
+"""Tests for the Numba-backed integer HashMap."""
+
+import random
+
+import pytest
+
+pytest.importorskip("numba")
+
+from dsa_lab.hashmap_numba import HashMapNumba  # noqa: E402
+
+
+class TestHashMapNumba:
+    """Basic HashMapNumba tests."""
+
+    def test_insert_get_remove(self) -> None:
+        m = HashMapNumba()
+        assert m.insert(1, 10) is None
+        assert m.insert(1, 11) == 10
+        assert m.get(1) == 11
+        assert 1 in m
+        assert m.remove(1) == 11
+        assert m.get(1) is None
+        assert len(m) == 0
+
+    def test_resize(self) -> None:
+        m = HashMapNumba(capacity=4)
+        for i in range(1000):
+            m.insert(i, i * 2)
+
+        assert len(m) == 1000
+        assert m.capacity & (m.capacity - 1) == 0
+        for i in range(1000):
+            assert m.get(i) == i * 2
+
+    def test_remove_churn_does_not_grow(self) -> None:
+        m = HashMapNumba()
+        for i in range(100_000):
+            m.insert(i, i)
+            m.remove(i)
+
+        assert len(m) == 0
+        assert m.capacity == 16
+
+    def test_bulk_insert(self) -> None:
+        np = pytest.importorskip("numpy")
+        m = HashMapNumba()
+        m.insert(0, 100)
+        m.remove(0)
+        m.insert(1, 100)
+        keys = np.array([0, 1, 2, 3, 2] + list(range(10, 1000)), dtype=np.int64)
+        m.bulk_insert(keys, keys * 2)
+
+        assert len(m) == 994
+        assert m.get(1) == 2
+        assert m.get(2) == 4
+        for i in range(10, 1000):
+            assert m.get(i) == i * 2
+
+    def test_bulk_insert_rejects_float_keys(self) -> None:
+        np = pytest.importorskip("numpy")
+        m = HashMapNumba()
+        with pytest.raises(TypeError):
+            m.bulk_insert(np.array([1.5]), np.array([1], dtype=np.int64))
+        assert len(m) == 0
+
+    def test_rejects_float_keys_and_values(self) -> None:
+        m = HashMapNumba()
+        with pytest.raises(TypeError):
+            m.insert(1.5, 2)
+        with pytest.raises(TypeError):
+            m.insert(1, 2.5)
+        assert len(m) == 0
+        m.insert(1, 2)
+        with pytest.raises(TypeError):
+            m.get(1.5)
+        with pytest.raises(TypeError):
+            m.remove(1.0)
+        with pytest.raises(TypeError):
+            1.5 in m
+        assert m.get(1) == 2
+
+    def test_bulk_insert_rejects_length_mismatch(self) -> None:
+        np = pytest.importorskip("numpy")
+        m = HashMapNumba()
+        with pytest.raises(ValueError):
+            m.bulk_insert(np.arange(8), np.arange(2))
+        with pytest.raises(ValueError):
+            m.bulk_insert(np.arange(4).reshape(2, 2), np.arange(4).reshape(2, 2))
+        assert len(m) == 0
+
+    def test_clear(self) -> None:
+        m = HashMapNumba()
+        m.insert(1, 1)
+        m.insert(2, 2)
+        m.clear()
+        assert len(m) == 0
+        assert m.get(1) is None
+        assert list(m) == []
+
+    def test_oracle_mixed_operations(self) -> None:
+        rng = random.Random(42)
+        our_map = HashMapNumba()
+        std_map: dict[int, int] = {}
+
+        for _ in range(10000):
+            op = rng.randint(0, 2)
+            key = rng.randint(-50, 49)
+            value = rng.randint(0, 999)
+
+            if op == 0:
+                assert our_map.insert(key, value) == std_map.get(key)
+                std_map[key] = value
+            elif op == 1:
+                assert our_map.get(key) == std_map.get(key)
+            else:
+                assert our_map.remove(key) == std_map.pop(key, None)
+
+        assert len(our_map) == len(std_map)
+        assert dict(our_map.items()) == std_map
@@ -1,14 +1,13 @@
 """Oracle tests comparing HashMap against built-in dict."""
 
 import random
-from dsa_lab import HashMap
 
 
 class TestOracleComparison:
     """Compare HashMap against Python's built-in dict."""
 
-    def test_insert_get(self) -> None:
-        our_map = HashMap()
+    def test_insert_get(self, hashmap_cls: type) -> None:
+        our_map = hashmap_cls()
         std_map: dict[str, str] = {}
 
         for i in range(1000):
@@ -26,8 +25,8 @@ class TestOracleComparison:
         # Non-existent key
         assert our_map.get("nonexistent") == std_map.get("nonexistent")
 
-    def test_overwrite(self) -> None:
-        our_map = HashMap()
+    def test_overwrite(self, hashmap_cls: type) -> None:
+        our_map = hashmap_cls()
         std_map: dict[str, str] = {}
 
         # Insert initial values
@@ -49,8 +48,8 @@ class TestOracleComparison:
             key = f"key_{i}"
             assert our_map.get(key) == std_map[key]
 
-    def test_remove(self) -> None:
-        our_map = HashMap()
+    def test_remove(self, hashmap_cls: type) -> None:
+        our_map = hashmap_cls()
         std_map: dict[str, str] = {}
 
         # Insert
@@ -73,9 +72,9 @@ class TestOracleComparison:
             assert our_map.get(key) == std_map.get(key)
             assert our_map.contains(key) == (key in std_map)
 
-    def test_mixed_operations(self) -> None:
+    def test_mixed_operations(self, hashmap_cls: type) -> None:
         rng = random.Random(42)
-        our_map = HashMap()
+        our_map = hashmap_cls()
         std_map: dict[str, str] = {}
 
         for _ in range(10000):
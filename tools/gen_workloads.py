@@ -9,9 +9,16 @@ All workloads use fixed seeds for reproducibility.
 import json
 import random
 import math
+from bisect import bisect_left
+from itertools import accumulate
 from pathlib import Path
 from typing import List, Dict, Any, Tuple
 
+try:
+    import numpy as np
+except ImportError:  # Optional: only needed for the columnar .npz output
+    np = None
+
 # Fixed seeds for reproducibility
 SEEDS = {
     "insert_heavy_uniform": 42,
@@ -36,6 +43,13 @@ OP_INSERT = "insert"
 OP_GET = "get"
 OP_DELETE = "delete"
 
+# Integer operation codes used by the columnar (.npz) workload format
+OP_CODES = {
+    OP_INSERT: 0,
+    OP_GET: 1,
+    OP_DELETE: 2,
+}
+
 
 def zipf_distribution(n: int, s: float = 1.0, seed: int = 0) -> List[int]:
     """
@@ -53,26 +67,16 @@ def zipf_distribution(n: int, s: float = 1.0, seed: int = 0) -> List[int]:
 
     # Precompute harmonic numbers for normalization
     max_k = 10000  # Maximum key value
-    harmonics = [0.0]
-    for k in range(1, max_k + 1):
-        harmonics.append(harmonics[-1] + 1.0 / (k ** s))
+    harmonics = list(
+        accumulate((1.0 / (k ** s) for k in range(1, max_k + 1)), initial=0.0)
+    )
 
     total = harmonics[-1]
-    samples = []
+    uniform = rng.random
 
-    for _ in range(n):
-        u = rng.random() * total
-        # Binary search for the key
-        lo, hi = 1, max_k
-        while lo < hi:
-            mid = (lo + hi) // 2
-            if harmonics[mid] < u:
-                lo = mid + 1
-            else:
-                hi = mid
-        samples.append(lo)
-
-    return samples
+    # bisect runs the per-sample binary search in C; the bounds select the
+    # first key in [1, max_k] whose cumulative weight reaches u.
+    return [bisect_left(harmonics, uniform() * total, 1, max_k) for _ in range(n)]
 
 
 def generate_keys(n: int, distribution: str, seed: int) -> List[str]:
@@ -80,8 +84,11 @@ def generate_keys(n: int, distribution: str, seed: int) -> List[str]:
     rng = random.Random(seed)
 
     if distribution == "uniform":
-        # Uniform random keys
-        return [f"key_{rng.randint(0, n * 10)}" for _ in range(n)]
+        # Uniform random keys in [0, n * 10]. randrange(stop) draws the same
+        # stream as randint(0, stop - 1) with less per-call overhead.
+        randrange = rng.randrange
+        stop = n * 10 + 1
+        return [f"key_{randrange(stop)}" for _ in range(n)]
     elif distribution == "zipf":
         # Zipf-distributed keys (some keys appear much more frequently)
         indices = zipf_distribution(n, s=1.0, seed=seed)
@@ -93,7 +100,8 @@ def generate_keys(n: int, distribution: str, seed: int) -> List[str]:
 def generate_values(n: int, seed: int) -> List[str]:
     """Generate n random values."""
     rng = random.Random(seed)
-    return [f"value_{rng.randint(0, 1_000_000)}" for _ in range(n)]
+    randrange = rng.randrange
+    return [f"value_{randrange(1_000_001)}" for _ in range(n)]
 
 
 def generate_workload(
@@ -122,21 +130,23 @@ def generate_workload(
     total_weight = sum(op_weights.values())
     normalized = {k: v / total_weight for k, v in op_weights.items()}
 
+    # Cumulative weight thresholds, computed once rather than per operation
+    thresholds = list(zip(accumulate(normalized.values()), normalized))
+
     # Pre-generate keys and values
     keys = generate_keys(size, distribution, seed)
     values = generate_values(size, seed + 1000)
 
     operations = []
     inserted_keys = set()
+    uniform = rng.random
 
     for i in range(size):
         # Select operation based on weights
-        r = rng.random()
-        cumulative = 0.0
+        r = uniform()
         op_type = OP_INSERT
 
-        for op, weight in normalized.items():
-            cumulative += weight
+        for cumulative, op in thresholds:
             if r < cumulative:
                 op_type = op
                 break
@@ -179,6 +189,36 @@ def generate_workload(
     }
 
 
+def write_jsonl(workload: Dict[str, Any], filepath: Path) -> None:
+    """
+    Write a workload's operations as JSON Lines, one operation per line.
+
+    Unlike the single JSON document, this can be parsed one operation at a
+    time without materializing the whole operations list.
+    """
+    with open(filepath, "w") as f:
+        for op in workload["operations"]:
+            f.write(json.dumps(op, separators=(",", ":")))
+            f.write("\n")
+
+
+def write_columnar(workload: Dict[str, Any], filepath: Path) -> None:
+    """
+    Write a workload's operations as parallel arrays in a .npz file.
+
+    The arrays are ``ops`` (uint8 codes from OP_CODES), ``keys`` and
+    ``values`` (fixed-width unicode; empty for non-insert operations), so
+    loading needs neither JSON parsing nor per-operation dict construction.
+    """
+    operations = workload["operations"]
+    np.savez_compressed(
+        filepath,
+        ops=np.array([OP_CODES[op["op"]] for op in operations], dtype=np.uint8),
+        keys=np.array([op["key"] for op in operations], dtype=str),
+        values=np.array([op.get("value", "") for op in operations], dtype=str),
+    )
+
+
 def main():
     """Generate all workloads."""
     root = Path(__file__).parent.parent
@@ -224,6 +264,15 @@ def main():
                 with open(filepath, "w") as f:
                     json.dump(workload, f, indent=2)
 
+                write_jsonl(workload, workloads_dir / f"{name}.jsonl")
+
+                npz_path = workloads_dir / f"{name}.npz"
+                if np is not None:
+                    write_columnar(workload, npz_path)
+                else:
+                    # Don't leave a columnar file from an earlier run behind
+                    npz_path.unlink(missing_ok=True)
+
                 generated.append(filename)
 
     # Write manifest
@@ -5,53 +5,219 @@ Benchmark Report Generator for dsa-lab
 Merges benchmark results from all languages into a unified Markdown report.
 """
 
-import json
+import functools
+import hashlib
+import mmap
 import os
+import pickle
 import re
+import shutil
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, List, Any, Optional
-
-
-def parse_criterion_results(criterion_dir: Path) -> Dict[str, Any]:
-    """Parse Rust Criterion benchmark results."""
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    from json import loads as json_loads
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; times are then formatted one by one
+    np = None
+
+try:
+    import ijson
+except ImportError:  # ijson is optional; JSON files are then parsed in full
+    ijson = None
+
+# Match: BenchmarkName-8    1000000    1234 ns/op    456 B/op    7 allocs/op
+# Applied to the whole file at once, so each match is anchored at a line start
+# and field separators ([^\S\n], whitespace except newline) cannot span lines.
+GO_BENCH_RE = re.compile(
+    rb"^(Benchmark\w+)[-\d]*[^\S\n]+\d+[^\S\n]+([\d.]+)[^\S\n]+(ns|us|ms)/op",
+    re.MULTILINE,
+)
+
+# Nanoseconds per Go time unit
+GO_UNIT_NS = {b"ns": 1, b"us": 1000, b"ms": 1_000_000}
+
+if np is not None:
+    # Divisor and suffix for each unit index used by format_times
+    TIME_DIVISORS = np.array([1, 1000, 1_000_000, 1_000_000_000], dtype=np.float64)
+    TIME_SUFFIXES = np.array([" ns", " us", " ms", " s"])
+
+# Upper bound on concurrent estimates.json reads. The reads are small and
+# latency-bound, so more are kept in flight than there are cores, while
+# staying well below typical file descriptor limits.
+MAX_IO_WORKERS = 64
+
+# Entries from which format_times uses the Numba kernel; below this, importing
+# numba costs more than it saves
+NUMBA_MIN_ROWS = 100_000
+
+# Report emitted when there are no raw results at all
+EMPTY_REPORT = b"# dsa-lab Benchmark Report\n\n*No results.*\n"
+
+# Bump when the shape of parsed results changes to invalidate cached entries
+CACHE_VERSION = 2
+
+T = TypeVar("T")
+
+
+def disk_cached(parse: Callable[[Path], T]) -> Callable[..., T]:
+    """Memoize a single-file parser on disk.
+
+    The wrapped parser takes an optional ``cache_dir``. Each input path has
+    one pickle entry, stamped with the file's mtime and size, so a file is
+    only parsed again after it changes and the new result replaces the old
+    one. Missing files are never cached, and cache I/O errors only cost the
+    cache: the parsed result is returned regardless.
+    """
+
+    @functools.wraps(parse)
+    def wrapper(path: Path, cache_dir: Optional[Path] = None) -> T:
+        if cache_dir is None:
+            return parse(path)
+
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return parse(path)
+
+        key = hashlib.blake2b(f"{parse.__name__}:{path}".encode()).hexdigest()
+        cache_file = cache_dir / f"{key}.pkl"
+        stamp = (CACHE_VERSION, stat.st_mtime_ns, stat.st_size)
+
+        try:
+            with open(cache_file, "rb") as f:
+                cached_stamp, cached_result = pickle.load(f)
+        except (OSError, EOFError, ValueError, pickle.UnpicklingError):
+            pass
+        else:
+            if cached_stamp == stamp:
+                return cached_result
+
+        result = parse(path)
+
+        # Write to a temporary file first so concurrent readers never see a
+        # partial entry
+        tmp_file = cache_file.with_name(
+            f"{cache_file.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(tmp_file, "wb") as f:
+                pickle.dump((stamp, result), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            try:
+                tmp_file.unlink(missing_ok=True)
+            except OSError:
+                pass
+
+        return result
+
+    return wrapper
+
+
+@disk_cached
+def load_criterion_mean(estimates_file: Path) -> Optional[float]:
+    """Read mean.point_estimate from a Criterion estimates.json file.
+
+    Returns None if the file does not exist. With ijson installed the file is
+    streamed and parsing stops at the mean, skipping the other estimates.
+    """
+    if not estimates_file.exists():
+        return None
+
+    if ijson is None:
+        data = json_loads(estimates_file.read_bytes())
+        return data.get("mean", {}).get("point_estimate", 0)
+
+    with open(estimates_file, "rb") as f:
+        return next(
+            (
+                value
+                for prefix, _, value in ijson.parse(f, use_float=True)
+                if prefix == "mean.point_estimate"
+            ),
+            0,
+        )
+
+
+def parse_criterion_results(
+    criterion_dir: Path, cache_dir: Optional[Path] = None
+) -> Dict[str, float]:
+    """Parse Rust Criterion benchmark results.
+
+    Each estimates file is cached on its own in ``cache_dir`` (if given), so
+    a new benchmark only costs parsing its own file.
+    """
     results = {}
 
     if not criterion_dir.exists():
         return results
 
-    for bench_dir in criterion_dir.iterdir():
-        if not bench_dir.is_dir() or bench_dir.name.startswith("."):
-            continue
+    # Look for estimates.json in each benchmark directory
+    bench_names = []
+    estimates_files = []
+    # scandir serves names and entry types from the directory listing itself,
+    # so only symlinked entries need a stat call
+    with os.scandir(criterion_dir) as entries:
+        for entry in entries:
+            if entry.name.startswith(".") or not entry.is_dir():
+                continue
+            # Names are interned in every parser: the same benchmark name
+            # usually appears for several languages
+            bench_names.append(sys.intern(entry.name))
+            estimates_files.append(Path(entry.path, "new", "estimates.json"))
+
+    if not estimates_files:
+        return results
 
-        # Look for estimates.json
-        estimates_file = bench_dir / "new" / "estimates.json"
-        if estimates_file.exists():
-            with open(estimates_file) as f:
-                data = json.load(f)
+    # Each file is independent, so read and parse them concurrently
+    max_workers = min(MAX_IO_WORKERS, len(estimates_files))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        means = executor.map(load_criterion_mean, estimates_files, repeat(cache_dir))
 
-            mean_ns = data.get("mean", {}).get("point_estimate", 0)
-            results[bench_dir.name] = {
-                "mean_ns": mean_ns,
-                "mean_us": mean_ns / 1000,
-                "mean_ms": mean_ns / 1_000_000,
-            }
+        for name, mean_ns in zip(bench_names, means):
+            if mean_ns is None:
+                continue
+
+            results[name] = mean_ns
 
     return results
 
 
-def parse_google_bench_results(json_file: Path) -> Dict[str, Any]:
+def iter_benchmarks(json_file: Path) -> Iterator[Dict[str, Any]]:
+    """Yield each entry of a JSON file's top-level "benchmarks" array.
+
+    With ijson installed the file is streamed, so only one entry is held in
+    memory at a time.
+    """
+    if ijson is None:
+        yield from json_loads(json_file.read_bytes()).get("benchmarks", [])
+        return
+
+    with open(json_file, "rb") as f:
+        yield from ijson.items(f, "benchmarks.item", use_float=True)
+
+
+@disk_cached
+def parse_google_bench_results(json_file: Path) -> Dict[str, float]:
     """Parse Google Benchmark JSON output."""
     results = {}
 
     if not json_file.exists():
         return results
 
-    with open(json_file) as f:
-        data = json.load(f)
-
-    for bench in data.get("benchmarks", []):
-        name = bench.get("name", "unknown")
+    for bench in iter_benchmarks(json_file):
+        name = sys.intern(bench.get("name", "unknown"))
         time_ns = bench.get("real_time", 0)
         time_unit = bench.get("time_unit", "ns")
 
@@ -61,220 +227,245 @@ def parse_google_bench_results(json_file: Path) -> Dict[str, Any]:
         elif time_unit == "ms":
             time_ns *= 1_000_000
 
-        results[name] = {
-            "mean_ns": time_ns,
-            "mean_us": time_ns / 1000,
-            "mean_ms": time_ns / 1_000_000,
-        }
+        results[name] = time_ns
 
     return results
 
 
-def parse_go_bench_results(txt_file: Path) -> Dict[str, Any]:
-    """Parse Go benchmark text output."""
-    results = {}
+def scan_go_bench_output(data: bytes) -> Dict[str, float]:
+    """Extract benchmark means (ns) from Go benchmark output held in memory.
 
-    if not txt_file.exists():
-        return results
+    A single finditer call over the whole buffer keeps the per-line loop
+    inside the regex engine.
+    """
+    results = {}
 
-    with open(txt_file) as f:
-        for line in f:
-            # Match: BenchmarkName-8    1000000    1234 ns/op    456 B/op    7 allocs/op
-            match = re.match(
-                r"(Benchmark\w+)[-\d]*\s+\d+\s+([\d.]+)\s+(ns|us|ms)/op",
-                line
-            )
-            if match:
-                name = match.group(1)
-                time_val = float(match.group(2))
-                unit = match.group(3)
-
-                # Normalize to nanoseconds
-                if unit == "us":
-                    time_val *= 1000
-                elif unit == "ms":
-                    time_val *= 1_000_000
-
-                results[name] = {
-                    "mean_ns": time_val,
-                    "mean_us": time_val / 1000,
-                    "mean_ms": time_val / 1_000_000,
-                }
+    for match in GO_BENCH_RE.finditer(data):
+        name = sys.intern(match.group(1).decode("ascii"))
+        # Normalize to nanoseconds
+        results[name] = float(match.group(2)) * GO_UNIT_NS[match.group(3)]
 
     return results
 
 
-def parse_pytest_bench_results(json_file: Path) -> Dict[str, Any]:
+@disk_cached
+def parse_go_bench_results(txt_file: Path) -> Dict[str, float]:
+    """Parse Go benchmark text output."""
+    if not txt_file.exists():
+        return {}
+
+    try:
+        with open(txt_file, "rb") as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mm:
+            return scan_go_bench_output(mm)
+    except (OSError, ValueError):
+        # Empty files and non-regular files (pipes, some network or FUSE
+        # mounts) cannot be mapped; read them whole in one call instead
+        return scan_go_bench_output(txt_file.read_bytes())
+
+
+@disk_cached
+def parse_pytest_bench_results(json_file: Path) -> Dict[str, float]:
     """Parse pytest-benchmark JSON output."""
     results = {}
 
     if not json_file.exists():
         return results
 
-    with open(json_file) as f:
-        data = json.load(f)
-
-    for bench in data.get("benchmarks", []):
-        name = bench.get("name", "unknown")
+    for bench in iter_benchmarks(json_file):
+        name = sys.intern(bench.get("name", "unknown"))
         stats = bench.get("stats", {})
         mean_s = stats.get("mean", 0)
 
-        results[name] = {
-            "mean_ns": mean_s * 1_000_000_000,
-            "mean_us": mean_s * 1_000_000,
-            "mean_ms": mean_s * 1000,
-        }
+        results[name] = mean_s * 1_000_000_000
 
     return results
 
 
-def format_time(ns: float) -> str:
-    """Format time in appropriate units."""
+TIME_UNITS = ("ns", "us", "ms", "s")
+
+
+def _scale(ns: float) -> Tuple[float, int]:
+    """Scale a time in ns to its display unit, returning (value, unit index)."""
     if ns < 1000:
-        return f"{ns:.2f} ns"
+        return ns, 0
     elif ns < 1_000_000:
-        return f"{ns/1000:.2f} us"
+        return ns / 1000, 1
     elif ns < 1_000_000_000:
-        return f"{ns/1_000_000:.2f} ms"
+        return ns / 1_000_000, 2
+    else:
+        return ns / 1_000_000_000, 3
+
+
+@functools.lru_cache(maxsize=None)
+def load_scale_array() -> Optional[Callable]:
+    """Import the Numba scaling kernel on first use, or None without numba."""
+    try:
+        from report_numba import scale_array
+    except ImportError:  # numba is optional; scaling then stays in NumPy
+        return None
+    return scale_array
+
+
+def format_time(ns: float) -> str:
+    """Format time in appropriate units."""
+    value, unit = _scale(ns)
+    return f"{value:.2f} {TIME_UNITS[unit]}"
+
+
+def format_times(results: Dict[str, float]) -> Dict[str, str]:
+    """Format every time in a results map, matching format_time per entry.
+
+    With numpy installed the unit selection and scaling run as array
+    operations instead of a Python branch per benchmark. From NUMBA_MIN_ROWS
+    entries on, they run in one compiled Numba loop if numba is available.
+    """
+    if np is None or not results:
+        return {name: format_time(ns) for name, ns in results.items()}
+
+    arr = np.fromiter(results.values(), dtype=np.float64, count=len(results))
+    scale_array = load_scale_array() if len(arr) >= NUMBA_MIN_ROWS else None
+    if scale_array is not None:
+        scaled, unit = scale_array(arr)
     else:
-        return f"{ns/1_000_000_000:.2f} s"
+        # Unit index 0..3 (ns, us, ms, s); NaN falls through to seconds like _scale
+        unit = 3 - (arr < 1000) - (arr < 1_000_000) - (arr < 1_000_000_000)
+        scaled = arr / TIME_DIVISORS[unit]
+    formatted = np.char.add(np.char.mod("%.2f", scaled), TIME_SUFFIXES[unit])
+    return dict(zip(results, formatted.tolist()))
 
 
+@disk_cached
 def load_env_info(env_file: Path) -> Dict[str, str]:
     """Load environment info from JSON file."""
     if not env_file.exists():
         return {}
 
-    with open(env_file) as f:
-        return json.load(f)
+    return json_loads(env_file.read_bytes())
+
 
+def generate_report(root: Path, now: datetime) -> bytes:
+    """Generate the full benchmark report as UTF-8 encoded Markdown.
 
-def generate_report(root: Path) -> str:
-    """Generate the full benchmark report."""
+    ``now`` is the generation time shown in the report header.
+    """
     raw_dir = root / "reports" / "raw"
+    cache_dir = root / "reports" / ".cache"
+
+    # Skip the parsers entirely when there is nothing to parse
+    try:
+        with os.scandir(raw_dir) as entries:
+            if next(entries, None) is None:
+                return EMPTY_REPORT
+    except FileNotFoundError:
+        return EMPTY_REPORT
+
+    # Parse results from each language and load environment info. The
+    # sources are independent, so read and parse them concurrently.
+    tasks = {
+        "rust": (parse_criterion_results, raw_dir / "rust_criterion"),
+        "cpp": (parse_google_bench_results, raw_dir / "cpp_bench.json"),
+        "go": (parse_go_bench_results, raw_dir / "go_bench.txt"),
+        "python": (parse_pytest_bench_results, raw_dir / "python_bench.json"),
+        "env": (load_env_info, raw_dir / "env.json"),
+    }
+    with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+        futures = {
+            name: executor.submit(fn, path, cache_dir)
+            for name, (fn, path) in tasks.items()
+        }
+        parsed = {name: future.result() for name, future in futures.items()}
 
-    # Parse results from each language
-    rust_results = parse_criterion_results(raw_dir / "rust_criterion")
-    cpp_results = parse_google_bench_results(raw_dir / "cpp_bench.json")
-    go_results = parse_go_bench_results(raw_dir / "go_bench.txt")
-    python_results = parse_pytest_bench_results(raw_dir / "python_bench.json")
+    rust_results = parsed["rust"]
+    cpp_results = parsed["cpp"]
+    go_results = parsed["go"]
+    python_results = parsed["python"]
+    env_info = parsed["env"]
 
-    # Load environment info
-    env_info = load_env_info(raw_dir / "env.json")
+    rust_times = format_times(rust_results)
+    cpp_times = format_times(cpp_results)
+    go_times = format_times(go_results)
+    python_times = format_times(python_results)
 
-    # Build report
-    lines = [
-        "# dsa-lab Benchmark Report",
-        "",
-        f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-        "",
-    ]
+    # Build report directly as UTF-8 bytes in one growing buffer
+    buf = bytearray()
+    write = buf.extend
+
+    write(b"# dsa-lab Benchmark Report\n\n")
+    write(f"**Generated:** {now.strftime('%Y-%m-%d %H:%M:%S')}\n\n".encode())
 
     # Environment section
     if env_info:
-        lines.extend([
-            "## Environment",
-            "",
-            "| Property | Value |",
-            "|----------|-------|",
-        ])
+        write(
+            b"## Environment\n"
+            b"\n"
+            b"| Property | Value |\n"
+            b"|----------|-------|\n"
+        )
         for key, value in env_info.items():
-            lines.append(f"| {key} | {value} |")
-        lines.append("")
+            write(f"| {key} | {value} |\n".encode())
+        write(b"\n")
 
     # Results summary
-    lines.extend([
-        "## Results Summary",
-        "",
-        "### Hash Map Operations",
-        "",
-    ])
-
-    # Build comparison table
-    all_benchmarks = set()
-    all_benchmarks.update(rust_results.keys())
-    all_benchmarks.update(cpp_results.keys())
-    all_benchmarks.update(go_results.keys())
-    all_benchmarks.update(python_results.keys())
-
-    if all_benchmarks:
-        lines.extend([
-            "| Benchmark | Rust | C++ | Go | Python |",
-            "|-----------|------|-----|-------|--------|",
-        ])
-
-        for bench in sorted(all_benchmarks):
-            rust_time = format_time(rust_results.get(bench, {}).get("mean_ns", 0)) if bench in rust_results else "-"
-            cpp_time = format_time(cpp_results.get(bench, {}).get("mean_ns", 0)) if bench in cpp_results else "-"
-            go_time = format_time(go_results.get(bench, {}).get("mean_ns", 0)) if bench in go_results else "-"
-            python_time = format_time(python_results.get(bench, {}).get("mean_ns", 0)) if bench in python_results else "-"
-
-            lines.append(f"| {bench} | {rust_time} | {cpp_time} | {go_time} | {python_time} |")
-
-        lines.append("")
+    write(b"## Results Summary\n\n### Hash Map Operations\n\n")
+
+    if rust_results or cpp_results or go_results or python_results:
+        # Build comparison table: one row of cells per benchmark, filled in a
+        # single pass over each language so the rows need no per-language lookups
+        all_benchmarks: Dict[str, List[str]] = {}
+        for column, times in enumerate((rust_times, cpp_times, go_times, python_times)):
+            for name, time_str in times.items():
+                all_benchmarks.setdefault(name, ["-", "-", "-", "-"])[column] = time_str
+
+        write(
+            b"| Benchmark | Rust | C++ | Go | Python |\n"
+            b"|-----------|------|-----|-------|--------|\n"
+        )
+
+        for bench, cells in sorted(all_benchmarks.items()):
+            write(f"| {bench} | {' | '.join(cells)} |\n".encode())
+
+        write(b"\n")
     else:
-        lines.extend([
-            "*No benchmark results found. Run `just bench` to generate results.*",
-            "",
-        ])
+        write(
+            b"*No benchmark results found. Run `just bench` to generate results.*\n"
+            b"\n"
+        )
 
     # Detailed sections per language
-    if rust_results:
-        lines.extend([
-            "## Rust (Criterion)",
-            "",
-            "| Benchmark | Mean Time |",
-            "|-----------|-----------|",
-        ])
-        for name, data in sorted(rust_results.items()):
-            lines.append(f"| {name} | {format_time(data['mean_ns'])} |")
-        lines.append("")
-
-    if cpp_results:
-        lines.extend([
-            "## C++ (Google Benchmark)",
-            "",
-            "| Benchmark | Mean Time |",
-            "|-----------|-----------|",
-        ])
-        for name, data in sorted(cpp_results.items()):
-            lines.append(f"| {name} | {format_time(data['mean_ns'])} |")
-        lines.append("")
-
-    if go_results:
-        lines.extend([
-            "## Go (testing.B)",
-            "",
-            "| Benchmark | Mean Time |",
-            "|-----------|-----------|",
-        ])
-        for name, data in sorted(go_results.items()):
-            lines.append(f"| {name} | {format_time(data['mean_ns'])} |")
-        lines.append("")
-
-    if python_results:
-        lines.extend([
-            "## Python (pytest-benchmark)",
-            "",
-            "| Benchmark | Mean Time |",
-            "|-----------|-----------|",
-        ])
-        for name, data in sorted(python_results.items()):
-            lines.append(f"| {name} | {format_time(data['mean_ns'])} |")
-        lines.append("")
+    sections = (
+        ("Rust (Criterion)", rust_times),
+        ("C++ (Google Benchmark)", cpp_times),
+        ("Go (testing.B)", go_times),
+        ("Python (pytest-benchmark)", python_times),
+    )
+    for title, times in sections:
+        if not times:
+            continue
+        write(
+            f"## {title}\n"
+            "\n"
+            "| Benchmark | Mean Time |\n"
+            "|-----------|-----------|\n".encode()
+        )
+        rows = "".join(
+            f"| {name} | {time_str} |\n" for name, time_str in sorted(times.items())
+        )
+        write(rows.encode())
+        write(b"\n")
 
     # Notes
-    lines.extend([
-        "## Notes",
-        "",
-        "- All benchmarks run with release/optimized builds",
-        "- Times are mean values across multiple iterations",
-        "- Lower is better",
-        "- Results may vary based on system load and hardware",
-        "",
-    ])
+    write(
+        b"## Notes\n"
+        b"\n"
+        b"- All benchmarks run with release/optimized builds\n"
+        b"- Times are mean values across multiple iterations\n"
+        b"- Lower is better\n"
+        b"- Results may vary based on system load and hardware\n"
+    )
 
-    return "\n".join(lines)
+    return bytes(buf)
 
 
 def main():
@@ -286,24 +477,32 @@ def main():
     # Also create raw directory if it doesn't exist
     (reports_dir / "raw").mkdir(parents=True, exist_ok=True)
 
-    report = generate_report(root)
-
-    # Write latest report
-    latest_file = reports_dir / "latest.md"
-    with open(latest_file, "w") as f:
-        f.write(report)
-
-    print(f"Report written to {latest_file}")
+    # One timestamp for both the report header and the archive name
+    now = datetime.now()
+    report = generate_report(root, now)
 
-    # Optionally archive to history
+    # Write the report once, into the history archive
     history_dir = reports_dir / "history"
     history_dir.mkdir(parents=True, exist_ok=True)
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = now.strftime("%Y%m%d_%H%M%S")
     history_file = history_dir / f"report_{timestamp}.md"
-    with open(history_file, "w") as f:
+    with open(history_file, "wb") as f:
         f.write(report)
 
+    # Point latest.md at the same data with a hard link (or a kernel-side copy
+    # across devices). It is swapped in by rename rather than rewritten in
+    # place, so earlier archived reports linked to it are never modified.
+    latest_file = reports_dir / "latest.md"
+    tmp_file = latest_file.with_name(f".{latest_file.name}.tmp")
+    tmp_file.unlink(missing_ok=True)
+    try:
+        os.link(history_file, tmp_file)
+    except OSError:
+        shutil.copyfile(history_file, tmp_file)
+    os.replace(tmp_file, latest_file)
+
+    print(f"Report written to {latest_file}")
     print(f"Archived to {history_file}")
 
 
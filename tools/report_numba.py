@@ -0,0 +1,31 @@
+"""
+Numba kernels for report.py.
+
+Imported lazily, and only for large reports: importing numba and loading the
+cached kernel costs far more than formatting a few thousand times with NumPy.
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def scale_array(arr):
+    """Scale times in ns to their display units in one compiled loop.
+
+    Returns (scaled, unit) arrays, with unit indices 0..3 for ns, us, ms and s
+    as in report.format_time; NaN falls through to seconds.
+    """
+    scaled = np.empty_like(arr)
+    unit = np.empty(arr.shape[0], dtype=np.intp)
+    for i in range(arr.shape[0]):
+        ns = arr[i]
+        if ns < 1000:
+            scaled[i], unit[i] = ns, 0
+        elif ns < 1_000_000:
+            scaled[i], unit[i] = ns / 1000, 1
+        elif ns < 1_000_000_000:
+            scaled[i], unit[i] = ns / 1_000_000, 2
+        else:
+            scaled[i], unit[i] = ns / 1_000_000_000, 3
+    return scaled, unit
@@ -0,0 +1,186 @@
+"""Tests for the benchmark report generator."""
+
+import math
+import os
+import random
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import report  # noqa: E402
+from report import (  # noqa: E402
+    disk_cached,
+    format_time,
+    format_times,
+    scan_go_bench_output,
+)
+
+
+def make_parser(calls: list):
+    """Return a disk-cached parser that records each real parse in ``calls``."""
+
+    @disk_cached
+    def parse(path: Path) -> str:
+        calls.append(path)
+        return path.read_text()
+
+    return parse
+
+
+class TestDiskCached:
+    """Hit, miss and invalidation behaviour of disk_cached."""
+
+    def test_hit_skips_parse(self, tmp_path: Path) -> None:
+        calls: list = []
+        parse = make_parser(calls)
+        src = tmp_path / "input.txt"
+        src.write_text("one")
+
+        assert parse(src, tmp_path / "cache") == "one"
+        assert parse(src, tmp_path / "cache") == "one"
+        assert len(calls) == 1
+
+    def test_change_invalidates_and_replaces_entry(self, tmp_path: Path) -> None:
+        calls: list = []
+        parse = make_parser(calls)
+        cache_dir = tmp_path / "cache"
+        src = tmp_path / "input.txt"
+        src.write_text("one")
+        parse(src, cache_dir)
+
+        src.write_text("two!")
+        stat = src.stat()
+        os.utime(src, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert parse(src, cache_dir) == "two!"
+        assert len(calls) == 2
+        assert len(list(cache_dir.iterdir())) == 1
+
+    def test_unwritable_cache_still_returns_result(self, tmp_path: Path) -> None:
+        calls: list = []
+        parse = make_parser(calls)
+        cache_dir = tmp_path / "cache"
+        cache_dir.write_text("not a directory")
+        src = tmp_path / "input.txt"
+        src.write_text("one")
+
+        assert parse(src, cache_dir) == "one"
+        assert parse(src, cache_dir) == "one"
+        assert len(calls) == 2
+        assert list(tmp_path.glob("*.tmp")) == []
+
+    def test_missing_file_is_not_cached(self, tmp_path: Path) -> None:
+        calls: list = []
+
+        @disk_cached
+        def parse(path: Path) -> dict:
+            calls.append(path)
+            return {}
+
+        assert parse(tmp_path / "missing.txt", tmp_path / "cache") == {}
+        assert not (tmp_path / "cache").exists()
+
+
+# Unit and rounding boundaries, specials, and a spread of random magnitudes
+FORMAT_BOUNDARIES = [
+    0,
+    1,
+    7,
+    999.99,
+    999.994,
+    999.995,
+    999.9999,
+    1000,
+    123456.789,
+    1_000_000 - 0.001,
+    1_000_000,
+    5e8,
+    1e9 - 1,
+    1e9,
+    3.3e12,
+    -5,
+    math.inf,
+    -math.inf,
+    math.nan,
+]
+
+
+class TestFormatTimes:
+    """format_times must match format_time on every code path."""
+
+    @pytest.mark.parametrize("path", ["numpy", "python", "numba"])
+    def test_matches_format_time(
+        self, path: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        if path == "python":
+            monkeypatch.setattr(report, "np", None)
+        elif path == "numpy":
+            pytest.importorskip("numpy")
+            monkeypatch.setattr(report, "NUMBA_MIN_ROWS", math.inf)
+        else:
+            pytest.importorskip("numba")
+            monkeypatch.setattr(report, "NUMBA_MIN_ROWS", 1)
+            assert report.load_scale_array() is not None
+
+        rng = random.Random(0)
+        values = FORMAT_BOUNDARIES + [rng.lognormvariate(10, 5) for _ in range(1000)]
+        results = {f"bench{i}": value for i, value in enumerate(values)}
+
+        expected = {name: format_time(value) for name, value in results.items()}
+        assert format_times(results) == expected
+
+
+class TestScanGoBenchOutput:
+    """The whole-buffer Go regex accepts exactly the per-line matches."""
+
+    def test_units_are_normalized_to_ns(self) -> None:
+        data = (
+            b"BenchmarkNs-8 1000 12.5 ns/op\n"
+            b"BenchmarkUs-8 100 3.25 us/op 16 B/op 1 allocs/op\n"
+            b"BenchmarkMs 10 2 ms/op\n"
+        )
+        assert scan_go_bench_output(data) == {
+            "BenchmarkNs": 12.5,
+            "BenchmarkUs": 3250.0,
+            "BenchmarkMs": 2_000_000.0,
+        }
+
+    def test_crlf_line_endings(self) -> None:
+        data = b"BenchmarkA-8\t 1000\t 5 ns/op\r\nBenchmarkB-8 10 7 us/op\r\n"
+        assert scan_go_bench_output(data) == {"BenchmarkA": 5.0, "BenchmarkB": 7000.0}
+
+    def test_indented_line_does_not_match(self) -> None:
+        data = b"  BenchmarkIndented-8 1000 5 ns/op\nxx BenchmarkMid-8 1 2 ns/op\n"
+        assert scan_go_bench_output(data) == {}
+
+    def test_truncated_line_does_not_match(self) -> None:
+        data = (
+            b"BenchmarkSplit-8\n"
+            b"1000 5 ns/op\n"
+            b"BenchmarkNoUnit-8 1000 5\n"
+            b"BenchmarkCut-8 1000"
+        )
+        assert scan_go_bench_output(data) == {}
+
+    def test_matches_per_line_regex(self) -> None:
+        data = (
+            b"goos: linux\n"
+            b"BenchmarkMixedUniformMedium-8   \t    2000\t    605162 ns/op\n"
+            b"BenchmarkGet/size=100-8 100 1 ns/op\n"
+            b"PASS\n"
+            b"BenchmarkLast 1 1.5 ms/op"
+        )
+        # The pre-mmap parser: re.match per line with \s separators
+        per_line = re.compile(r"(Benchmark\w+)[-\d]*\s+\d+\s+([\d.]+)\s+(ns|us|ms)/op")
+        expected = {}
+        for line in data.decode().splitlines(keepends=True):
+            match = per_line.match(line)
+            if match:
+                scale = {"ns": 1, "us": 1000, "ms": 1_000_000}[match.group(3)]
+                expected[match.group(1)] = float(match.group(2)) * scale
+
+        assert scan_go_bench_output(data) == expected